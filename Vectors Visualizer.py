@@ -1,11 +1,18 @@
+import base64
+import math
+import re
+from collections import OrderedDict
+from io import BytesIO
 import tkinter as tk
 from tkinter import ttk, messagebox
-import matplotlib
-matplotlib.use("TkAgg")
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-import numpy as np
-from mpl_toolkits.mplot3d import Axes3D
+
+# NumPy is imported on first compute by load_numpy(), Matplotlib on first plot by load_matplotlib()
+np = None
+Figure = None
+FigureCanvasTkAgg = None
+NavigationToolbar2Tk = None
+LineCollection = None
+to_rgba_array = None
 
 # ---------- Colors / config ----------
 BORDER_COLOR = "#0e466b"
@@ -17,6 +24,16 @@ BUTTON_BG = "#0e466b"
 SOLUTION_BLUE = "#1e5aa8"
 HOVER_BG = "#4a6fa5"
 ENTRY_BG = "#f8f9fa"
+PLOT_DPI = 72
+NUMBER_PREFIX = re.compile(r"-?\d*\.?\d*")  # A number, or the start of one
+LABEL_BBOX = dict(boxstyle="round,pad=0.3", facecolor='white', alpha=0.7)
+
+# ---------- Shared widget styles ----------
+BODY_FONT = ("Arial", 11)
+BOLD_FONT = ("Arial", 11, "bold")
+PRIMARY_BTN_STYLE = dict(bg="#1a5490", fg="white", font=BOLD_FONT, cursor="hand2", padx=20, pady=8)
+SECONDARY_BTN_STYLE = dict(bg="#7f8c8d", fg="white", font=BODY_FONT, cursor="hand2", padx=15, pady=8)
+RESULT_LABEL_STYLE = dict(font=BOLD_FONT, bg="white", fg=PRIMARY_GREEN)
 
 # ---------- App ----------
 class VectorLearningApp:
@@ -38,6 +55,9 @@ class VectorLearningApp:
         # Show first lesson
         self.show_lesson("Vector Basics")
         
+        # Build the other lessons in the background so their first click is instant
+        self.root.after(200, self.preload_lessons)
+        
         # Bind window resize event for responsive centering
         self.root.bind("<Configure>", self.on_window_resize)
     
@@ -86,41 +106,80 @@ class VectorLearningApp:
         # Create the scrollable main area
         self.main_area = tk.Frame(self.main_canvas, bg="white")
         self.main_canvas_window = self.main_canvas.create_window(0, 0, anchor="nw", window=self.main_area)
+        self.scroll_pending = None
+        self.last_scrollregion = None
+        self.content_offset = 0
         
         # Bind mousewheel for scrolling
         self.bind_mousewheel()
     
     def bind_mousewheel(self):
-        """Enable mousewheel scrolling"""
-        def on_mousewheel(event):
-            self.main_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        self.main_canvas.bind_all("<MouseWheel>", on_mousewheel)  # Windows
-        self.main_canvas.bind_all("<Button-4>", lambda e: self.main_canvas.yview_scroll(-1, "units"))  # Linux
-        self.main_canvas.bind_all("<Button-5>", lambda e: self.main_canvas.yview_scroll(1, "units"))  # Linux
+        """Enable mousewheel scrolling while the pointer is over the main area"""
+        self.wheel_units = 0
+        self.wheel_pending = False
+        self.main_container.bind("<Enter>", self.enable_mousewheel)
+        self.main_container.bind("<Leave>", self.disable_mousewheel)
+    
+    def enable_mousewheel(self, event=None):
+        """Route wheel events to the main area"""
+        self.main_canvas.bind_all("<MouseWheel>", 
+                                  lambda e: self.queue_scroll(int(-1*(e.delta/120))))  # Windows
+        self.main_canvas.bind_all("<Button-4>", lambda e: self.queue_scroll(-1))  # Linux
+        self.main_canvas.bind_all("<Button-5>", lambda e: self.queue_scroll(1))  # Linux
+    
+    def disable_mousewheel(self, event):
+        """Stop routing wheel events once the pointer leaves the main area"""
+        # Moving onto a child widget also sends <Leave>, so check where the pointer is
+        pointer = str(self.root.tk.call("winfo", "containing", event.x_root, event.y_root))
+        if pointer.startswith(str(self.main_container)):
+            return
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.main_canvas.unbind_all(sequence)
+    
+    def queue_scroll(self, units):
+        """Accumulate wheel ticks and apply them at most once per frame"""
+        self.wheel_units += units
+        if not self.wheel_pending:
+            self.wheel_pending = True
+            self.root.after(16, self.flush_scroll)
+    
+    def flush_scroll(self):
+        """Apply the accumulated wheel ticks in a single scroll"""
+        if self.wheel_units:
+            self.main_canvas.yview_scroll(self.wheel_units, "units")
+        self.wheel_units = 0
+        self.wheel_pending = False
     
     def update_main_scroll(self):
         """Update scroll region"""
-        self.main_area.update_idletasks()
-        self.main_canvas.config(scrollregion=self.main_canvas.bbox("all"))
+        self.scroll_pending = None
+        
+        # Geometry settles on its own; only reconfigure when the region moved
+        scrollregion = self.main_canvas.bbox("all")
+        if scrollregion != self.last_scrollregion:
+            self.last_scrollregion = scrollregion
+            self.main_canvas.config(scrollregion=scrollregion)
         
         # Center the content horizontally when window is wider than content
         canvas_width = self.main_canvas.winfo_width()
         content_width = self.main_area.winfo_reqwidth()
+        x_offset = max(0, (canvas_width - content_width) // 2)
         
-        if canvas_width > content_width:
-            x_offset = (canvas_width - content_width) // 2
+        if x_offset != self.content_offset:
+            self.content_offset = x_offset
             self.main_canvas.coords(self.main_canvas_window, x_offset, 0)
-        else:
-            self.main_canvas.coords(self.main_canvas_window, 0, 0)
     
     def on_window_resize(self, event=None):
         """Handle window resize for responsive centering"""
-        self.update_main_scroll()
+        # Resizing sends a burst of <Configure> events; update once it settles
+        if self.scroll_pending is not None:
+            self.root.after_cancel(self.scroll_pending)
+        self.scroll_pending = self.root.after(100, self.update_main_scroll)
     
     def init_lessons(self):
         """Initialize lesson structure"""
         self.lesson_frames = {}
+        self.lesson_controllers = {}
         self.lessons = [
             "Vector Basics",
             "Vector Addition & Subtraction",
@@ -136,7 +195,7 @@ class VectorLearningApp:
             
             btn = tk.Button(btn_frame, text=f"{icon} {lesson}", 
                            fg="white", bg="#34495e",
-                           font=("Arial", 11), relief="flat",
+                           font=BODY_FONT, relief="flat",
                            activebackground=HOVER_BG, activeforeground="white",
                            cursor="hand2", pady=10,
                            command=lambda l=lesson: self.show_lesson(l))
@@ -155,160 +214,379 @@ class VectorLearningApp:
                              command=self.reset_all)
         reset_btn.pack(fill="x", padx=8, pady=10)
     
+    def ensure_lesson(self, name):
+        """Create a lesson's frame if it doesn't exist yet"""
+        if name in self.lesson_frames:
+            return
+        
+        f = tk.Frame(self.main_area, bg="white")
+        self.lesson_frames[name] = f
+        
+        if name == "Vector Basics":
+            controller = VectorBasicsLesson(f, self)
+        elif name == "Vector Addition & Subtraction":
+            controller = VectorAddSubLesson(f, self)
+        elif name == "Vector Scaling":
+            controller = VectorScalingLesson(f, self)
+        elif name == "Vector Magnitude & Direction":
+            controller = VectorMagnitudeLesson(f, self)
+        self.lesson_controllers[name] = controller
+    
+    def preload_lessons(self, index=1):
+        """Build the remaining lesson frames, one per idle slot"""
+        if index >= len(self.lessons):
+            return
+        self.ensure_lesson(self.lessons[index])
+        self.root.after_idle(self.preload_lessons, index + 1)
+    
     def show_lesson(self, name):
         """Show selected lesson"""
         for f in self.lesson_frames.values():
             f.pack_forget()
         
-        # Create frame if it doesn't exist
-        if name not in self.lesson_frames:
-            f = tk.Frame(self.main_area, bg="white")
-            self.lesson_frames[name] = f
-            
-            if name == "Vector Basics":
-                VectorBasicsLesson(f, self)
-            elif name == "Vector Addition & Subtraction":
-                VectorAddSubLesson(f, self)
-            elif name == "Vector Scaling":
-                VectorScalingLesson(f, self)
-            elif name == "Vector Magnitude & Direction":
-                VectorMagnitudeLesson(f, self)
-        
+        self.ensure_lesson(name)
         self.lesson_frames[name].pack(fill="both", expand=True)
         self.update_main_scroll()
     
     def reset_all(self):
         """Reset all lessons"""
         if messagebox.askyesno("Reset", "Reset all vector inputs and plots?"):
-            for frame in self.lesson_frames.values():
-                frame.destroy()
-            self.lesson_frames.clear()
+            # Restore each lesson's defaults in place instead of rebuilding every widget
+            for controller in self.lesson_controllers.values():
+                controller.restore_defaults()
             self.show_lesson(self.lessons[0])
 
 # ------------- Helper Classes and Functions -------------
 
+def load_numpy():
+    """Import NumPy on first use; building the UI never needs it"""
+    global np
+    if np is None:
+        import numpy as np
+
+def load_matplotlib():
+    """Import Matplotlib on first use so the window appears without waiting for it"""
+    global Figure, FigureCanvasTkAgg, NavigationToolbar2Tk, LineCollection, to_rgba_array
+    if Figure is not None:
+        return
+    load_numpy()
+    import matplotlib
+    matplotlib.use("TkAgg")
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+    from matplotlib.collections import LineCollection
+    from matplotlib.colors import to_rgba_array
+    from matplotlib.figure import Figure
+
+def magnitude(vec):
+    """Length of a 3-component vector, skipping np.linalg.norm's dispatch overhead"""
+    return math.hypot(vec[0], vec[1], vec[2])  # One C call, and overflow-safe
+
+def normalize(vec, out=None):
+    """Magnitude and unit direction of a 3-component vector (zero direction for a zero vector)"""
+    if out is None:
+        out = np.empty(3)
+    mag = magnitude(vec)
+    
+    # Scale by the reciprocal, or by 0 for a zero vector, without branching
+    np.multiply(vec, (mag > 1e-10) / (mag or 1.0), out=out)
+    out += 0.0  # Turns the -0.0 that negative components scale to into 0.0
+    return mag, out
+
 class VectorInput(tk.Frame):
     """Reusable vector input widget with validation"""
     def __init__(self, parent, label="Vector", default_values=(0, 0, 0), **kwargs):
         super().__init__(parent, **kwargs)
         self.entries = []
+        self.defaults = default_values
+        self.vector = None  # Output buffer reused by every get_vector() call
         self.create_widgets(label, default_values)
     
     def create_widgets(self, label, defaults):
-        tk.Label(self, text=f"{label}:", font=("Arial", 11, "bold"),
+        tk.Label(self, text=f"{label}:", font=BOLD_FONT,
                 bg=self.cget("bg"), fg="white").grid(row=0, column=0, pady=5, sticky="w")
         
+        # Tk rejects edits that fail validation, so entries only ever hold numbers
+        vcmd = (self.register(self.validate_input), "%P")
+        
         for i, (comp, val) in enumerate(zip(["X", "Y", "Z"], defaults)):
             tk.Label(self, text=f"{comp}:", bg=self.cget("bg"), fg="white",
                     font=("Arial", 10)).grid(row=1, column=2*i, padx=(10, 5), pady=3)
             
             e = tk.Entry(self, width=8, font=("Arial", 10), bg=ENTRY_BG,
-                        relief="solid", bd=1)
+                        relief="solid", bd=1, validate="key", validatecommand=vcmd)
             e.insert(0, str(val))
             e.grid(row=1, column=2*i+1, padx=(0, 10), pady=3)
-            
-            # Add validation
-            e.bind("<KeyRelease>", self.validate_input)
             self.entries.append(e)
     
-    def validate_input(self, event):
-        """Validate numeric input"""
-        entry = event.widget
-        value = entry.get()
-        if value and value != "-":
-            try:
-                float(value)
-                entry.config(bg=ENTRY_BG)
-            except ValueError:
-                entry.config(bg="#ffcccc")
+    def validate_input(self, new_text):
+        """Allow an edit only if the entry still holds a number or the start of one"""
+        return NUMBER_PREFIX.fullmatch(new_text) is not None
     
     def get_vector(self):
-        """Get vector as numpy array with validation"""
-        vec = []
-        for e in self.entries:
-            v = e.get().strip()
-            if v == "" or v == "-":
-                vec.append(0.0)
-            else:
-                try:
-                    vec.append(float(v))
-                except ValueError:
-                    vec.append(0.0)
-        return np.array(vec)
+        """Get vector as numpy array, treating empty or partial entries as 0"""
+        if self.vector is None:
+            load_numpy()
+            self.vector = np.empty(3)
+        vec = self.vector  # Refilled on every call, so callers copy it to keep a value
+        for i, e in enumerate(self.entries):
+            v = e.get()
+            vec[i] = float(v) if v.strip("-.") else 0.0  # Anything with a digit parses
+        return vec
     
     def reset(self):
         """Reset to zero vector"""
         for e in self.entries:
             e.delete(0, tk.END)
             e.insert(0, "0")
+    
+    def restore_defaults(self):
+        """Refill the entries with the values the widget was built with"""
+        for e, val in zip(self.entries, self.defaults):
+            e.delete(0, tk.END)
+            e.insert(0, str(val))
 
 class PlotManager:
     """Manages plot creation and updates with better centering"""
     @staticmethod
-    def plot_vectors(tab, vectors, colors, labels, title, limits=10, show_toolbar=True):
-        """Create centered vector plot with optional toolbar"""
-        # Clear previous plot elements
-        PlotManager.clear_plot(tab)
+    def plot_vectors(tab, vectors, colors, labels, title, limits=10, show_toolbar=True,
+                     force_2d=False):
+        """Create centered vector plot from an (N, 3) array and N colors, with optional toolbar"""
+        load_matplotlib()
         
-        # Create centered plot frame
-        plot_container = tk.Frame(tab, bg="white")
-        plot_container.pack(expand=True, fill="both", padx=20, pady=15)
-        tab.plot_container = plot_container
-        
-        # Create inner frame for centering
-        plot_frame = tk.Frame(plot_container, bg="white", relief="solid", bd=2)
-        plot_frame.pack(expand=True)  # This centers the frame
-        tab.plot_frame = plot_frame
-        
-        # Determine plot dimensions and type
-        needs_3d = any(abs(vec[2]) > 1e-10 for vec in vectors if len(vec) >= 3)
+        # Determine plot type and which vectors are long enough to draw
+        vecs, needs_3d, shown = PlotManager.scan_vectors(vectors, force_2d)
         
-        # Create figure with appropriate size
+        # Figure size depends on the plot type
         fig_width = 8 if needs_3d else 7
         fig_height = 6 if needs_3d else 5
         
-        fig = plt.figure(figsize=(fig_width, fig_height), facecolor='white', dpi=100)
+        # Reuse the tab's figure and canvas, creating them on first plot
+        if not hasattr(tab, 'fig'):
+            PlotManager.create_canvas(tab, fig_width, fig_height)
+        else:
+            PlotManager.resize_canvas(tab, fig_width, fig_height)
         
-        # Create plot
+        # Add navigation toolbar if requested, reusing it across plots
+        if show_toolbar and not hasattr(tab, 'toolbar'):
+            toolbar_frame = tk.Frame(tab.plot_frame, bg="white")
+            toolbar_frame.pack(fill="x")
+            tab.toolbar = NavigationToolbar2Tk(tab.canvas, toolbar_frame)
+        if hasattr(tab, 'toolbar'):
+            tab.toolbar.update()  # New data starts a fresh zoom/pan history
+        
+        if not tab.plot_container.winfo_manager():
+            tab.plot_container.pack(expand=True, fill="both", padx=20, pady=15)
+        
+        # Create plot from the drawable vectors only
+        ax = PlotManager.get_axes(tab, needs_3d)
+        tab.background = None
+        tips = vecs[shown, :3 if needs_3d else 2]
+        shown_colors = to_rgba_array(colors)[shown]
+        shown_labels = [label for label, keep in zip(labels, shown) if keep]
+        tip_texts = PlotManager.tip_texts(vecs[shown], shown_labels, needs_3d)
         if needs_3d:
-            ax = fig.add_subplot(111, projection='3d')
-            PlotManager.setup_3d_plot(ax, vectors, colors, labels, limits)
+            tab.arrows, tab.tip_labels = PlotManager.setup_3d_plot(ax, tips, shown_colors,
+                                                                   shown_labels, tip_texts, limits)
         else:
-            ax = fig.add_subplot(111)
-            PlotManager.setup_2d_plot(ax, vectors, colors, labels, limits)
+            tab.arrows, tab.tip_labels = PlotManager.setup_2d_plot(ax, tips, shown_colors,
+                                                                   shown_labels, tip_texts, limits)
+        tab.plot_key = PlotManager.plot_key(needs_3d, shown, labels, title, limits)
         
         ax.set_title(title, fontsize=14, weight='bold', pad=20)
         ax.grid(True, alpha=0.3, linestyle='--')
         
-        # Add legend if multiple vectors
+        # Add legend if multiple vectors, drawn after the animated 2D vectors so they never cover it
+        tab.legend = None
         if len(vectors) > 1:
-            ax.legend(loc='upper right', framealpha=0.9)
+            tab.legend = ax.legend(loc='upper right', framealpha=0.9)
+            tab.legend.set_animated(not needs_3d)
         
-        plt.tight_layout()
-        
-        # Create canvas
-        canvas = FigureCanvasTkAgg(fig, master=plot_frame)
-        canvas.draw()
-        canvas_widget = canvas.get_tk_widget()
-        canvas_widget.pack()
-        
-        # Add navigation toolbar if requested
-        if show_toolbar:
-            toolbar_frame = tk.Frame(plot_frame, bg="white")
-            toolbar_frame.pack(fill="x")
-            toolbar = NavigationToolbar2Tk(canvas, toolbar_frame)
-            toolbar.update()
-            tab.toolbar = toolbar
-        
-        tab.canvas_widget = canvas
+        tab.canvas.draw_idle()
         
         # Update scroll region after adding plot
         if hasattr(tab, 'master') and hasattr(tab.master, 'update_main_scroll'):
             tab.master.update_main_scroll()
     
     @staticmethod
-    def setup_3d_plot(ax, vectors, colors, labels, limits):
-        """Setup 3D plot with vectors"""
+    def update_vectors(tab, vectors, colors, labels, title, limits=10, show_toolbar=True,
+                       force_2d=False):
+        """Move the vectors of an existing plot in place, blitting 2D plots"""
+        vecs, needs_3d, shown = PlotManager.scan_vectors(vectors, force_2d)
+        
+        # Anything but moved arrows needs a full redraw, as does a zoomed, panned or rotated view
+        if (getattr(tab, 'plot_key', None) != PlotManager.plot_key(needs_3d, shown, labels,
+                                                                   title, limits)
+                or PlotManager.view_moved(tab.ax, needs_3d, limits)):
+            PlotManager.plot_vectors(tab, vectors, colors, labels, title, limits, show_toolbar,
+                                     force_2d)
+            return
+        
+        if not shown.any():
+            return
+        if hasattr(tab, 'toolbar'):
+            tab.toolbar.update()  # New data starts a fresh zoom/pan history
+        tips = vecs[shown, :3 if needs_3d else 2]
+        shown_labels = [label for label, keep in zip(labels, shown) if keep]
+        tip_texts = PlotManager.tip_texts(vecs[shown], shown_labels, needs_3d)
+        
+        tab.arrows.set_segments(PlotManager.arrow_segments(tips))
+        for tip, tip_text, text in zip(tips + limits * 0.05, tip_texts, tab.tip_labels):
+            text.set_position((tip[0], tip[1]))
+            if needs_3d:
+                text.set_3d_properties(tip[2])
+            text.set_text(tip_text)
+        
+        # Blitting is unreliable on 3D axes, and needs a cached background
+        if needs_3d or tab.background is None:
+            tab.canvas.draw_idle()
+            return
+        tab.canvas.restore_region(tab.background)
+        tab.ax.draw_artist(tab.arrows)
+        for text in tab.tip_labels:
+            tab.ax.draw_artist(text)
+        if tab.legend is not None:
+            tab.ax.draw_artist(tab.legend)
+        tab.canvas.blit(tab.fig.bbox)
+    
+    @staticmethod
+    def scan_vectors(vectors, force_2d=False):
+        """Stack vectors into an (N, 3) array, check for 3D and mask out zero-length vectors"""
+        vecs = np.asarray(vectors, dtype=np.float64)
+        
+        # 3D only when some vector leaves the XY plane (never in 2D mode)
+        needs_3d = (not force_2d and vecs.shape[1] >= 3
+                    and bool(np.abs(vecs[:, 2]).max() > 1e-10))
+        
+        shown = np.linalg.norm(vecs[:, :3 if needs_3d else 2], axis=1) > 1e-10
+        return vecs, needs_3d, shown
+    
+    @staticmethod
+    def tip_texts(vectors, labels, needs_3d):
+        """Format each vector's tip annotation up front, off the render loop"""
+        if needs_3d:
+            return [f"{label}\n({vec[0]:.2f}, {vec[1]:.2f}, {vec[2]:.2f})"
+                    for vec, label in zip(vectors, labels)]
+        return [f"{label}\n({vec[0]:.2f}, {vec[1]:.2f})" for vec, label in zip(vectors, labels)]
+    
+    @staticmethod
+    def plot_key(needs_3d, shown, labels, title, limits):
+        """Everything besides the arrow tips that a plot's layout depends on"""
+        return (needs_3d, tuple(shown.tolist()), tuple(labels), title, limits)
+    
+    @staticmethod
+    def view_moved(ax, needs_3d, limits):
+        """Whether the axes left their initial ±limits view (and 3D viewing angle)"""
+        view = list(ax.get_xlim() + ax.get_ylim())
+        home = [-limits, limits] * 2
+        if needs_3d:
+            view += list(ax.get_zlim()) + [ax.elev, ax.azim]
+            home += [-limits, limits, 20, 45]
+        return not np.allclose(view, home)
+    
+    @staticmethod
+    def on_draw(tab, event):
+        """Cache the static background and draw the animated vectors on top"""
+        if tab.plot_key is None or tab.plot_key[0]:
+            return
+        # savefig draws through a temporary canvas (possibly SVG/PDF), which has no pixels to cache
+        if event.canvas is tab.canvas:
+            tab.background = tab.canvas.copy_from_bbox(tab.fig.bbox)
+        if tab.arrows is not None:
+            tab.arrows.draw(event.renderer)
+        for text in tab.tip_labels:
+            text.draw(event.renderer)
+        if tab.legend is not None:
+            tab.legend.draw(event.renderer)
+    
+    @staticmethod
+    def create_canvas(tab, fig_width, fig_height):
+        """Create the tab's figure and canvas once"""
+        # Create centered plot frame
+        plot_container = tk.Frame(tab, bg="white")
+        tab.plot_container = plot_container
+        
+        # Create inner frame for centering
+        plot_frame = tk.Frame(plot_container, bg="white", relief="solid", bd=2)
+        plot_frame.pack(expand=True)  # This centers the frame
+        tab.plot_frame = plot_frame
+        
+        tab.fig = Figure(figsize=(fig_width, fig_height), facecolor='white', dpi=PLOT_DPI)
+        tab.fig.subplots_adjust(left=0.1, right=0.95, top=0.9, bottom=0.1)  # Fixed layout
+        tab.ax_2d = None
+        tab.ax_3d = None
+        tab.arrows = None
+        tab.tip_labels = []
+        tab.legend = None
+        tab.plot_key = None
+        tab.background = None
+        
+        # Create canvas
+        tab.canvas = FigureCanvasTkAgg(tab.fig, master=plot_frame)
+        tab.canvas.get_tk_widget().pack()
+        tab.canvas.mpl_connect('draw_event', lambda event: PlotManager.on_draw(tab, event))
+    
+    @staticmethod
+    def resize_canvas(tab, fig_width, fig_height):
+        """Resize the cached figure when switching between 2D and 3D"""
+        if tuple(tab.fig.get_size_inches()) == (fig_width, fig_height):
+            return
+        tab.fig.set_size_inches(fig_width, fig_height, forward=False)
+        tab.canvas.get_tk_widget().config(width=int(fig_width * PLOT_DPI),
+                                          height=int(fig_height * PLOT_DPI))
+    
+    @staticmethod
+    def get_axes(tab, needs_3d):
+        """Return the tab's cleared 2D or 3D axes, hiding the other one"""
+        name, other = ('ax_3d', 'ax_2d') if needs_3d else ('ax_2d', 'ax_3d')
+        if getattr(tab, other) is not None:
+            getattr(tab, other).set_visible(False)
+        
+        ax = getattr(tab, name)
+        if ax is None:
+            if needs_3d:
+                # Importing mplot3d registers the '3d' projection; 2D-only sessions skip it
+                from mpl_toolkits.mplot3d import Axes3D
+                ax = tab.fig.add_subplot(111, projection='3d')
+            else:
+                ax = tab.fig.add_subplot(111)
+            setattr(tab, name, ax)
+        else:
+            ax.cla()
+        ax.set_visible(True)
+        tab.ax = ax
+        return ax
+    
+    @staticmethod
+    def arrow_segments(tips, head_ratio=0.15):
+        """Shaft and two head barbs per vector as one (3N, 2, D) segment array"""
+        n, dim = tips.shape
+        lengths = np.linalg.norm(tips, axis=1, keepdims=True)
+        units = tips / lengths
+        
+        # Barbs open out along a direction perpendicular to each vector
+        if dim == 2:
+            perps = np.column_stack([-units[:, 1], units[:, 0]])
+        else:
+            perps = np.cross(units, [0.0, 0.0, 1.0])
+            vertical = np.linalg.norm(perps, axis=1) < 1e-6
+            perps[vertical] = np.cross(units[vertical], [1.0, 0.0, 0.0])
+            perps /= np.linalg.norm(perps, axis=1, keepdims=True)
+        
+        heads = tips - head_ratio * lengths * units
+        wings = 0.5 * head_ratio * lengths * perps
+        
+        segments = np.zeros((3 * n, 2, dim))
+        segments[:n, 1] = tips
+        segments[n:, 0] = np.concatenate([tips, tips])
+        segments[n:2 * n, 1] = heads + wings
+        segments[2 * n:, 1] = heads - wings
+        return segments
+    
+    @staticmethod
+    def setup_3d_plot(ax, tips, colors, labels, tip_texts, limits):
+        """Setup 3D plot with (N, 3) vector tips and (N, 4) RGBA colors, returning arrows and tip labels"""
+        from mpl_toolkits.mplot3d.art3d import Line3DCollection
+        
         ax.set_xlim(-limits, limits)
         ax.set_ylim(-limits, limits)
         ax.set_zlim(-limits, limits)
@@ -316,29 +594,32 @@ class PlotManager:
         ax.set_ylabel("Y", fontsize=12, labelpad=10)
         ax.set_zlabel("Z", fontsize=12, labelpad=10)
         
-        # Add origin point
-        ax.scatter([0], [0], [0], color='black', s=100, alpha=0.8, label='Origin')
-        
-        # Plot vectors
-        offset = limits * 0.05
-        for vec, color, label in zip(vectors, colors, labels):
-            if np.linalg.norm(vec) > 1e-10:
-                ax.quiver(0, 0, 0, vec[0], vec[1], vec[2], 
-                         color=color, linewidth=2.5, arrow_length_ratio=0.15,
-                         label=label, alpha=0.8)
-                
-                # Add text label at vector tip
-                ax.text(vec[0] + offset, vec[1] + offset, vec[2] + offset,
-                       f"{label}\n({vec[0]:.2f}, {vec[1]:.2f}, {vec[2]:.2f})",
-                       color=color, fontsize=9, weight='bold',
-                       bbox=dict(boxstyle="round,pad=0.3", facecolor='white', alpha=0.7))
+        # Plot all vectors as a single collection
+        if not len(tips):
+            ax.view_init(elev=20, azim=45)
+            return None, []
+        
+        arrows = Line3DCollection(PlotManager.arrow_segments(tips), colors=np.tile(colors, (3, 1)),
+                                  linewidths=2.5, alpha=0.8)
+        ax.add_collection3d(arrows)
+        
+        # Legend entries for the collection
+        for color, label in zip(colors, labels):
+            ax.plot([], [], color=color, linewidth=2.5, label=label)
+        
+        # Add text labels at vector tips
+        tip_labels = []
+        for tip, color, tip_text in zip(tips + limits * 0.05, colors, tip_texts):
+            tip_labels.append(ax.text(tip[0], tip[1], tip[2], tip_text,
+                                      color=color, fontsize=9, weight='bold'))
         
         # Set better viewing angle
         ax.view_init(elev=20, azim=45)
+        return arrows, tip_labels
     
     @staticmethod
-    def setup_2d_plot(ax, vectors, colors, labels, limits):
-        """Setup 2D plot with vectors"""
+    def setup_2d_plot(ax, tips, colors, labels, tip_texts, limits):
+        """Setup 2D plot with (N, 2) animated vector tips and (N, 4) RGBA colors, returning arrows and tip labels"""
         ax.set_xlim(-limits, limits)
         ax.set_ylim(-limits, limits)
         ax.set_xlabel("X", fontsize=12)
@@ -352,55 +633,177 @@ class PlotManager:
         ax.axhline(y=0, color='gray', linestyle='-', linewidth=0.5, alpha=0.5)
         ax.axvline(x=0, color='gray', linestyle='-', linewidth=0.5, alpha=0.5)
         
-        # Plot vectors
-        offset = limits * 0.05
-        for vec, color, label in zip(vectors, colors, labels):
-            if np.linalg.norm(vec[:2]) > 1e-10:
-                ax.quiver(0, 0, vec[0], vec[1], angles='xy', scale_units='xy', 
-                         scale=1, color=color, linewidth=2.5, width=0.008,
-                         label=label, alpha=0.8, zorder=3)
-                
-                # Add text label at vector tip
-                ax.text(vec[0] + offset, vec[1] + offset,
-                       f"{label}\n({vec[0]:.2f}, {vec[1]:.2f})",
-                       color=color, fontsize=9, weight='bold',
-                       bbox=dict(boxstyle="round,pad=0.3", facecolor='white', alpha=0.7))
+        # Plot all vectors as a single collection, kept out of the background for blitting
+        if not len(tips):
+            return None, []
+        
+        arrows = LineCollection(PlotManager.arrow_segments(tips), colors=np.tile(colors, (3, 1)),
+                                linewidths=2.5, alpha=0.8, zorder=3, animated=True)
+        ax.add_collection(arrows)
+        
+        # Legend entries for the collection
+        for color, label in zip(colors, labels):
+            ax.plot([], [], color=color, linewidth=2.5, label=label)
+        
+        # Add text labels at vector tips
+        tip_labels = []
+        for tip, color, tip_text in zip(tips + limits * 0.05, colors, tip_texts):
+            tip_labels.append(ax.text(tip[0], tip[1], tip_text, color=color, fontsize=9,
+                                      weight='bold', animated=True, bbox=LABEL_BBOX))
+        return arrows, tip_labels
     
     @staticmethod
     def clear_plot(tab):
-        """Clear previous plot elements"""
-        for attr in ['canvas_widget', 'toolbar', 'plot_frame', 'plot_container']:
-            if hasattr(tab, attr):
-                widget = getattr(tab, attr)
-                if widget and hasattr(widget, 'destroy'):
-                    try:
-                        widget.destroy()
-                    except:
-                        pass
+        """Hide the plot and release its artists, keeping the figure, axes and canvas for reuse"""
+        if hasattr(tab, 'plot_container'):
+            tab.plot_container.pack_forget()
+        if hasattr(tab, 'vector_container'):
+            tab.vector_container.pack_forget()
+            tab.vector_canvas.delete("all")
+        if hasattr(tab, 'fig'):
+            # Only Matplotlib tabs get here (not the magnitude lesson's Tk canvas). Clearing
+            # the axes rather than the figure spares the next plot from rebuilding them.
+            for ax in (tab.ax_2d, tab.ax_3d):
+                if ax is not None:
+                    ax.cla()
+            tab.arrows = None
+            tab.tip_labels = []
+            tab.legend = None
+            tab.plot_key = None
+            tab.background = None
+
+class TkVectorCanvas:
+    """Draws the magnitude lesson's single arrow straight onto a Tk canvas, without Matplotlib"""
+    SIZE = 400
+    # Oblique view: X to the right, Z up, Y receding up-right at half depth. Unlike an
+    # isometric or Matplotlib-style view it never collapses positive-octant vectors.
+    DEPTH = 0.5 * math.sqrt(0.5)
+    
+    @staticmethod
+    def draw(tab, vec, color, label, title, limits=10, force_2d=False):
+        """Draw one vector with its axes, replacing the tab's previous drawing"""
+        vecs, needs_3d, shown = PlotManager.scan_vectors([vec], force_2d)
+        
+        if not hasattr(tab, 'vector_canvas'):
+            TkVectorCanvas.create_canvas(tab)
+        if not tab.vector_container.winfo_manager():
+            tab.vector_container.pack(expand=True, fill="both", padx=20, pady=15)
+        
+        canvas = tab.vector_canvas
+        canvas.delete("all")
+        half = TkVectorCanvas.SIZE / 2
+        canvas.create_text(half, 18, text=title, font=("Arial", 14, "bold"))
+        
+        # Coordinate axes through the origin
+        for axis, name in enumerate("XYZ" if needs_3d else "XY"):
+            end = np.zeros(3)
+            end[axis] = limits
+            x0, y0 = TkVectorCanvas.project(-end, limits, needs_3d)
+            x1, y1 = TkVectorCanvas.project(end, limits, needs_3d)
+            canvas.create_line(x0, y0, x1, y1, fill="gray", dash=(2, 2))
+            canvas.create_text(x1 + 6, y1, text=name, anchor="w", fill="gray",
+                               font=("Arial", 10, "bold"))
+        canvas.create_oval(half - 4, half - 4, half + 4, half + 4, fill="black", outline="")
+        
+        # The vector itself, with its tip annotation
+        if shown[0]:
+            x1, y1 = TkVectorCanvas.project(vecs[0], limits, needs_3d)
+            canvas.create_line(half, half, x1, y1, arrow=tk.LAST, fill=color, width=2)
+            tip_text = PlotManager.tip_texts(vecs, [label], needs_3d)[0]
+            tip = canvas.create_text(x1 + 6, y1 - 6, text=tip_text, anchor="sw", fill=color,
+                                     font=("Arial", 9, "bold"))
+            
+            # Nudge the label back inside the canvas when the tip is near an edge
+            left, top, right, bottom = canvas.bbox(tip)
+            size = TkVectorCanvas.SIZE
+            canvas.move(tip, max(0, 4 - left) - max(0, right - size + 4),
+                        max(0, 4 - top) - max(0, bottom - size + 4))
+        
+        # Update scroll region after adding plot
+        if hasattr(tab, 'master') and hasattr(tab.master, 'update_main_scroll'):
+            tab.master.update_main_scroll()
+    
+    @staticmethod
+    def project(point, limits, needs_3d):
+        """Screen position of a point: oblique in 3D, plain X/Y in 2D"""
+        half = TkVectorCanvas.SIZE / 2
+        scale = 0.8 * half / limits  # ±limits on each axis spans the canvas, leaving room for labels
+        x, y, z = point
+        if needs_3d:
+            depth = TkVectorCanvas.DEPTH * y
+            return half + (x + depth) * scale, half - (z + depth) * scale
+        return half + x * scale, half - y * scale
+    
+    @staticmethod
+    def create_canvas(tab):
+        """Create the tab's vector canvas once"""
+        tab.vector_container = tk.Frame(tab, bg="white")
+        tab.vector_canvas = tk.Canvas(tab.vector_container, width=TkVectorCanvas.SIZE,
+                                      height=TkVectorCanvas.SIZE, bg="white",
+                                      highlightthickness=0, relief="solid", bd=2)
+        tab.vector_canvas.pack(expand=True)
 
 class FormulaRenderer:
     """Handles LaTeX formula rendering"""
+    # Decoded images keyed by (latex_text, fontsize), least recently used first. The
+    # formula text already rounds its numbers, so nearby inputs share an entry.
+    cache = OrderedDict()
+    cache_size = 64
+    
     @staticmethod
     def render(parent_frame, latex_text, fontsize=12):
         """Render LaTeX formula in a frame"""
+        label = tk.Label(parent_frame, bg='#f0f8ff')
+        FormulaRenderer.update(label, latex_text, fontsize)
+        label.pack(fill="both", expand=True, padx=8, pady=6)
+        return label
+    
+    @staticmethod
+    def update(label, latex_text, fontsize=12):
+        """Show a LaTeX formula in an existing label"""
+        image = FormulaRenderer.image(latex_text, fontsize)
+        label.config(image=image)
+        label.image = image  # Keep a reference so Tk doesn't drop the image
+    
+    @staticmethod
+    def image(latex_text, fontsize):
+        """Return the formula as a PhotoImage, rendering and decoding it only on a cache miss"""
+        key = (latex_text, fontsize)
+        image = FormulaRenderer.cache.get(key)
+        if image is None:
+            image = tk.PhotoImage(data=FormulaRenderer.render_png(latex_text, fontsize))
+            FormulaRenderer.cache[key] = image
+            if len(FormulaRenderer.cache) > FormulaRenderer.cache_size:
+                FormulaRenderer.cache.popitem(last=False)
+        else:
+            FormulaRenderer.cache.move_to_end(key)
+        return image
+    
+    @staticmethod
+    def render_png(latex_text, fontsize):
+        """Rasterize a formula to base64-encoded PNG data"""
+        load_matplotlib()
+        
         lines = max(1, latex_text.count("\n") + 1)
         height = min(3.0, 1.2 + 0.3 * (lines - 1))
         
-        fig = plt.figure(figsize=(10, height), facecolor='#f0f8ff', dpi=80)
-        ax = fig.add_subplot(111)
+        fig = Figure(figsize=(10, height), facecolor='#f0f8ff', dpi=PLOT_DPI)
+        ax = fig.add_axes((0, 0, 1, 1))  # Whole figure, no layout pass needed
         ax.axis("off")
         ax.text(0.02, 0.5, latex_text, fontsize=fontsize, va='center', ha='left',
                color=SOLUTION_BLUE, weight='bold', transform=ax.transAxes)
-        plt.tight_layout(pad=0.5)
         
-        canvas = FigureCanvasTkAgg(fig, master=parent_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=8, pady=6)
-        return canvas
+        buffer = BytesIO()
+        fig.savefig(buffer, format='png')
+        return base64.b64encode(buffer.getvalue()).decode('ascii')
 
 # ------------- Lesson Classes -------------
 
 class VectorBasicsLesson:
+    FORMULA = (r"$|\vec{{V}}| = \sqrt{{X^2 + Y^2 + Z^2}}$" "\n"
+               r"$= \sqrt{{{0:.3f}^2 + {1:.3f}^2 + {2:.3f}^2}}$" "\n"
+               r"$= {3:.4f}$")
+    
     def __init__(self, parent, app):
         self.parent = parent
         self.app = app
@@ -412,25 +815,27 @@ class VectorBasicsLesson:
                         font=("Arial", 16, "bold"), bg="white", fg=BORDER_COLOR)
         title.pack(pady=(10, 20))
         
-        # Input frame
+        # Input frame, laid out as a single grid
         input_frame = tk.Frame(self.parent, bg=BUTTON_BG, bd=2, relief="raised")
         input_frame.pack(pady=10, padx=20)
+        input_frame.columnconfigure((0, 1), weight=1, uniform="half")
         
         self.vector_input = VectorInput(input_frame, "Enter Vector", 
                                        default_values=(3, 4, 2), bg=BUTTON_BG)
-        self.vector_input.pack(pady=10, padx=10)
+        self.vector_input.grid(row=0, column=0, columnspan=2, pady=10, padx=10)
         
-        # Buttons frame
-        btn_frame = tk.Frame(input_frame, bg=BUTTON_BG)
-        btn_frame.pack(pady=10)
+        # 2D plot
+        self.mode_2d = tk.BooleanVar(value=False)
+        tk.Checkbutton(input_frame, text="2D plot (hide Z axis)", variable=self.mode_2d,
+                      bg=BUTTON_BG, fg="white", selectcolor=BUTTON_BG,
+                      font=("Arial", 10), cursor="hand2").grid(row=1, column=0, columnspan=2)
         
-        tk.Button(btn_frame, text="📊 Plot Vector", command=self.plot,
-                 bg="#1a5490", fg="white", font=("Arial", 11, "bold"),
-                 cursor="hand2", padx=20, pady=8).pack(side="left", padx=5)
+        # Buttons
+        tk.Button(input_frame, text="📊 Plot Vector", command=self.plot,
+                 **PRIMARY_BTN_STYLE).grid(row=2, column=0, padx=5, pady=10, sticky="e")
         
-        tk.Button(btn_frame, text="🔄 Reset", command=self.reset,
-                 bg="#7f8c8d", fg="white", font=("Arial", 11),
-                 cursor="hand2", padx=15, pady=8).pack(side="left", padx=5)
+        tk.Button(input_frame, text="🔄 Reset", command=self.reset,
+                 **SECONDARY_BTN_STYLE).grid(row=2, column=1, padx=5, pady=10, sticky="w")
         
         # Info text
         info = tk.Label(self.parent, 
@@ -440,11 +845,12 @@ class VectorBasicsLesson:
     
     def plot(self):
         vec = self.vector_input.get_vector()
-        PlotManager.plot_vectors(self.parent, [vec], [PRIMARY_BLUE], ["V"], 
-                                "Vector Visualization", show_toolbar=True)
+        PlotManager.update_vectors(self.parent, [vec], [PRIMARY_BLUE], ["V"], 
+                                  "Vector Visualization", show_toolbar=True,
+                                  force_2d=self.mode_2d.get())
         
         # Calculate and display info
-        mag = np.linalg.norm(vec)
+        mag = magnitude(vec)
         self.show_info(vec, mag)
     
     def show_info(self, vec, mag):
@@ -454,7 +860,6 @@ class VectorBasicsLesson:
         
         # Create info panel
         self.info_frame = tk.Frame(self.parent, bg="#f5f5f5", bd=2, relief="groove")
-        self.info_frame.pack(fill="x", padx=20, pady=20)
         
         # Title
         tk.Label(self.info_frame, text="📐 Vector Analysis",
@@ -465,31 +870,49 @@ class VectorBasicsLesson:
         comp_frame.pack(fill="x", padx=20, pady=5)
         
         tk.Label(comp_frame, text=f"Components: ({vec[0]:.3f}, {vec[1]:.3f}, {vec[2]:.3f})",
-                font=("Arial", 11), bg="white", fg=PRIMARY_BLUE).pack(pady=8)
+                font=BODY_FONT, bg="white", fg=PRIMARY_BLUE).pack(pady=8)
         
         tk.Label(comp_frame, text=f"Magnitude: |V| = {mag:.4f}",
-                font=("Arial", 11, "bold"), bg="white", fg=PRIMARY_GREEN).pack(pady=8)
+                **RESULT_LABEL_STYLE).pack(pady=8)
         
         # Formula
         formula_frame = tk.Frame(self.info_frame, bg="#f0f8ff", bd=1, relief="solid")
         formula_frame.pack(fill="x", padx=20, pady=10)
         
-        formula = (r"$|\vec{V}| = \sqrt{X^2 + Y^2 + Z^2}$" + "\n" +
-                  r"$= \sqrt{" + f"{vec[0]:.3f}^2 + {vec[1]:.3f}^2 + {vec[2]:.3f}^2" + r"}$" + "\n" +
-                  r"$= " + f"{mag:.4f}" + r"$")
+        formula = self.FORMULA.format(*vec, mag)
         
         FormulaRenderer.render(formula_frame, formula, fontsize=13)
+        
+        # Pack the finished panel so the page lays out once, not once per child
+        self.info_frame.pack(fill="x", padx=20, pady=20)
     
     def reset(self):
         self.vector_input.reset()
         if hasattr(self, 'info_frame'):
             self.info_frame.destroy()
         PlotManager.clear_plot(self.parent)
+    
+    def restore_defaults(self):
+        """Put the lesson back as it was first built, for Reset All"""
+        self.reset()
+        self.vector_input.restore_defaults()
+        self.mode_2d.set(False)
 
 class VectorAddSubLesson:
+    ADD_FORMULA = (r"$\vec{{R}} = \vec{{A}} + \vec{{B}}$" "\n"
+                   r"$R_x = {0:.2f} + {3:.2f} = {6:.2f}$" "\n"
+                   r"$R_y = {1:.2f} + {4:.2f} = {7:.2f}$" "\n"
+                   r"$R_z = {2:.2f} + {5:.2f} = {8:.2f}$")
+    SUB_FORMULA = (r"$\vec{{R}} = \vec{{A}} - \vec{{B}}$" "\n"
+                   r"$R_x = {0:.2f} - {3:.2f} = {6:.2f}$" "\n"
+                   r"$R_y = {1:.2f} - {4:.2f} = {7:.2f}$" "\n"
+                   r"$R_z = {2:.2f} - {5:.2f} = {8:.2f}$")
+    
     def __init__(self, parent, app):
         self.parent = parent
         self.app = app
+        # Rows hold A, B and the result, allocated on first compute
+        self.vectors = None
         self.create_ui()
     
     def create_ui(self):
@@ -498,54 +921,61 @@ class VectorAddSubLesson:
                         font=("Arial", 16, "bold"), bg="white", fg=BORDER_COLOR)
         title.pack(pady=(10, 20))
         
-        # Input frame
+        # Input frame, laid out as a single grid
         input_frame = tk.Frame(self.parent, bg=BUTTON_BG, bd=2, relief="raised")
         input_frame.pack(pady=10, padx=20)
+        input_frame.columnconfigure((0, 1), weight=1, uniform="half")
         
         self.vector_a = VectorInput(input_frame, "Vector A", 
                                    default_values=(3, 2, 1), bg=BUTTON_BG)
-        self.vector_a.pack(pady=5, padx=10)
+        self.vector_a.grid(row=0, column=0, columnspan=2, pady=5, padx=10)
         
         self.vector_b = VectorInput(input_frame, "Vector B",
                                    default_values=(1, 3, -1), bg=BUTTON_BG)
-        self.vector_b.pack(pady=5, padx=10)
+        self.vector_b.grid(row=1, column=0, columnspan=2, pady=5, padx=10)
         
         # Operation selection
-        op_frame = tk.Frame(input_frame, bg=BUTTON_BG)
-        op_frame.pack(pady=10)
-        
-        tk.Label(op_frame, text="Operation:", bg=BUTTON_BG, fg="white",
-                font=("Arial", 11)).pack(side="left", padx=5)
+        tk.Label(input_frame, text="Operation:", bg=BUTTON_BG, fg="white",
+                font=BODY_FONT).grid(row=2, column=0, padx=5, sticky="e")
         
         self.op_var = tk.StringVar(value="Add")
-        for op in ["Add", "Subtract"]:
-            tk.Radiobutton(op_frame, text=op, variable=self.op_var, value=op,
+        for row, op in enumerate(["Add", "Subtract"], start=2):
+            tk.Radiobutton(input_frame, text=op, variable=self.op_var, value=op,
                           bg=BUTTON_BG, fg="white", selectcolor=BUTTON_BG,
-                          font=("Arial", 10), cursor="hand2").pack(side="left", padx=10)
+                          font=("Arial", 10), cursor="hand2").grid(row=row, column=1, padx=10, sticky="w")
         
-        # Buttons
-        btn_frame = tk.Frame(input_frame, bg=BUTTON_BG)
-        btn_frame.pack(pady=10)
+        # 2D plot
+        self.mode_2d = tk.BooleanVar(value=False)
+        tk.Checkbutton(input_frame, text="2D plot (hide Z axis)", variable=self.mode_2d,
+                      bg=BUTTON_BG, fg="white", selectcolor=BUTTON_BG,
+                      font=("Arial", 10), cursor="hand2").grid(row=4, column=0, columnspan=2)
         
-        tk.Button(btn_frame, text="📊 Compute & Plot", command=self.compute,
-                 bg="#1a5490", fg="white", font=("Arial", 11, "bold"),
-                 cursor="hand2", padx=20, pady=8).pack(side="left", padx=5)
+        # Buttons
+        tk.Button(input_frame, text="📊 Compute & Plot", command=self.compute,
+                 **PRIMARY_BTN_STYLE).grid(row=5, column=0, padx=5, pady=10, sticky="e")
         
-        tk.Button(btn_frame, text="🔄 Reset", command=self.reset,
-                 bg="#7f8c8d", fg="white", font=("Arial", 11),
-                 cursor="hand2", padx=15, pady=8).pack(side="left", padx=5)
+        tk.Button(input_frame, text="🔄 Reset", command=self.reset,
+                 **SECONDARY_BTN_STYLE).grid(row=5, column=1, padx=5, pady=10, sticky="w")
     
     def compute(self):
-        vec_a = self.vector_a.get_vector()
-        vec_b = self.vector_b.get_vector()
+        if self.vectors is None:
+            load_numpy()
+            self.vectors = np.empty((3, 3))
+        vec_a, vec_b, result = self.vectors
+        vec_a[:] = self.vector_a.get_vector()
+        vec_b[:] = self.vector_b.get_vector()
         op = self.op_var.get()
         
-        result = vec_a + vec_b if op == "Add" else vec_a - vec_b
+        if op == "Add":
+            np.add(vec_a, vec_b, out=result)
+        else:
+            np.subtract(vec_a, vec_b, out=result)
         
-        PlotManager.plot_vectors(self.parent, [vec_a, vec_b, result],
-                                [PRIMARY_BLUE, PRIMARY_RED, PRIMARY_GREEN],
-                                ["A", "B", "Result"],
-                                f"Vector {op}ition", limits=12)
+        PlotManager.update_vectors(self.parent, self.vectors,
+                                  [PRIMARY_BLUE, PRIMARY_RED, PRIMARY_GREEN],
+                                  ["A", "B", "Result"],
+                                  f"Vector {op}ition", limits=12,
+                                  force_2d=self.mode_2d.get())
         
         self.show_info(vec_a, vec_b, result, op)
     
@@ -554,9 +984,6 @@ class VectorAddSubLesson:
             self.info_frame.destroy()
         
         self.info_frame = tk.Frame(self.parent, bg="#f5f5f5", bd=2, relief="groove")
-        self.info_frame.pack(fill="x", padx=20, pady=20)
-        
-        sign = '+' if op == "Add" else '-'
         
         # Title
         tk.Label(self.info_frame, text=f"📐 {op}ition Result",
@@ -571,18 +998,19 @@ class VectorAddSubLesson:
         tk.Label(res_frame, text=f"B = ({vec_b[0]:.3f}, {vec_b[1]:.3f}, {vec_b[2]:.3f})",
                 font=("Arial", 10), bg="white", fg=PRIMARY_RED).pack(pady=3)
         tk.Label(res_frame, text=f"Result = ({result[0]:.3f}, {result[1]:.3f}, {result[2]:.3f})",
-                font=("Arial", 11, "bold"), bg="white", fg=PRIMARY_GREEN).pack(pady=5)
+                **RESULT_LABEL_STYLE).pack(pady=5)
         
         # Formula
         formula_frame = tk.Frame(self.info_frame, bg="#f0f8ff", bd=1, relief="solid")
         formula_frame.pack(fill="x", padx=20, pady=10)
         
-        formula = (r"$\vec{R} = \vec{A} " + (r"+ \vec{B}$" if op == "Add" else r"- \vec{B}$") + "\n" +
-                  r"$R_x = " + f"{vec_a[0]:.2f} {sign} {vec_b[0]:.2f} = {result[0]:.2f}$" + "\n" +
-                  r"$R_y = " + f"{vec_a[1]:.2f} {sign} {vec_b[1]:.2f} = {result[1]:.2f}$" + "\n" +
-                  r"$R_z = " + f"{vec_a[2]:.2f} {sign} {vec_b[2]:.2f} = {result[2]:.2f}$")
+        template = self.ADD_FORMULA if op == "Add" else self.SUB_FORMULA
+        formula = template.format(*vec_a, *vec_b, *result)
         
         FormulaRenderer.render(formula_frame, formula, fontsize=12)
+        
+        # Pack the finished panel so the page lays out once, not once per child
+        self.info_frame.pack(fill="x", padx=20, pady=20)
     
     def reset(self):
         self.vector_a.reset()
@@ -590,8 +1018,20 @@ class VectorAddSubLesson:
         if hasattr(self, 'info_frame'):
             self.info_frame.destroy()
         PlotManager.clear_plot(self.parent)
+    
+    def restore_defaults(self):
+        """Put the lesson back as it was first built, for Reset All"""
+        self.reset()
+        self.vector_a.restore_defaults()
+        self.vector_b.restore_defaults()
+        self.op_var.set("Add")
+        self.mode_2d.set(False)
 
 class VectorScalingLesson:
+    FORMULA = (r"$k \cdot \vec{{V}} = k \cdot (X, Y, Z)$" "\n"
+               r"$= ({0}·{1:.2f}, {0}·{2:.2f}, {0}·{3:.2f})$" "\n"
+               r"$= ({4:.2f}, {5:.2f}, {6:.2f})$")
+    
     def __init__(self, parent, app):
         self.parent = parent
         self.app = app
@@ -603,36 +1043,35 @@ class VectorScalingLesson:
                         font=("Arial", 16, "bold"), bg="white", fg=BORDER_COLOR)
         title.pack(pady=(10, 20))
         
-        # Input frame
+        # Input frame, laid out as a single grid
         input_frame = tk.Frame(self.parent, bg=BUTTON_BG, bd=2, relief="raised")
         input_frame.pack(pady=10, padx=20)
+        input_frame.columnconfigure((0, 1), weight=1, uniform="half")
         
         self.vector_input = VectorInput(input_frame, "Vector V",
                                        default_values=(2, 3, 1), bg=BUTTON_BG)
-        self.vector_input.pack(pady=5, padx=10)
-        
-                # Scalar input
-        scalar_frame = tk.Frame(input_frame, bg=BUTTON_BG)
-        scalar_frame.pack(pady=10)
+        self.vector_input.grid(row=0, column=0, columnspan=2, pady=5, padx=10)
         
-        tk.Label(scalar_frame, text="Scalar (k):", bg=BUTTON_BG, fg="white",
-                 font=("Arial", 11)).pack(side="left", padx=5)
-        self.scalar_entry = tk.Entry(scalar_frame, width=8, font=("Arial", 10),
+        # Scalar input
+        tk.Label(input_frame, text="Scalar (k):", bg=BUTTON_BG, fg="white",
+                 font=BODY_FONT).grid(row=1, column=0, padx=5, pady=10, sticky="e")
+        self.scalar_entry = tk.Entry(input_frame, width=8, font=("Arial", 10),
                                      bg=ENTRY_BG, relief="solid", bd=1)
         self.scalar_entry.insert(0, "2")
-        self.scalar_entry.pack(side="left", padx=5)
+        self.scalar_entry.grid(row=1, column=1, padx=5, pady=10, sticky="w")
         
-        # Buttons
-        btn_frame = tk.Frame(input_frame, bg=BUTTON_BG)
-        btn_frame.pack(pady=10)
+        # 2D plot
+        self.mode_2d = tk.BooleanVar(value=False)
+        tk.Checkbutton(input_frame, text="2D plot (hide Z axis)", variable=self.mode_2d,
+                      bg=BUTTON_BG, fg="white", selectcolor=BUTTON_BG,
+                      font=("Arial", 10), cursor="hand2").grid(row=2, column=0, columnspan=2)
         
-        tk.Button(btn_frame, text="📊 Compute & Plot", command=self.compute,
-                 bg="#1a5490", fg="white", font=("Arial", 11, "bold"),
-                 cursor="hand2", padx=20, pady=8).pack(side="left", padx=5)
+        # Buttons
+        tk.Button(input_frame, text="📊 Compute & Plot", command=self.compute,
+                 **PRIMARY_BTN_STYLE).grid(row=3, column=0, padx=5, pady=10, sticky="e")
         
-        tk.Button(btn_frame, text="🔄 Reset", command=self.reset,
-                 bg="#7f8c8d", fg="white", font=("Arial", 11),
-                 cursor="hand2", padx=15, pady=8).pack(side="left", padx=5)
+        tk.Button(input_frame, text="🔄 Reset", command=self.reset,
+                 **SECONDARY_BTN_STYLE).grid(row=3, column=1, padx=5, pady=10, sticky="w")
     
     def compute(self):
         vec = self.vector_input.get_vector()
@@ -644,9 +1083,10 @@ class VectorScalingLesson:
         
         scaled_vec = k * vec
         
-        PlotManager.plot_vectors(self.parent, [vec, scaled_vec],
-                                [PRIMARY_BLUE, PRIMARY_GREEN],
-                                ["V", f"{k}·V"], f"Vector Scaling (k={k})", limits=12)
+        PlotManager.update_vectors(self.parent, [vec, scaled_vec],
+                                  [PRIMARY_BLUE, PRIMARY_GREEN],
+                                  ["V", f"{k}·V"], f"Vector Scaling (k={k})", limits=12,
+                                  force_2d=self.mode_2d.get())
         
         self.show_info(vec, k, scaled_vec)
     
@@ -655,7 +1095,6 @@ class VectorScalingLesson:
             self.info_frame.destroy()
         
         self.info_frame = tk.Frame(self.parent, bg="#f5f5f5", bd=2, relief="groove")
-        self.info_frame.pack(fill="x", padx=20, pady=20)
         
         # Title
         tk.Label(self.info_frame, text="📐 Scalar Multiplication Result",
@@ -669,17 +1108,18 @@ class VectorScalingLesson:
                 font=("Arial", 10), bg="white", fg=PRIMARY_BLUE).pack(pady=3)
         tk.Label(res_frame, text=f"Scalar k = {k}", font=("Arial", 10), bg="white", fg=PRIMARY_RED).pack(pady=3)
         tk.Label(res_frame, text=f"Scaled Vector k·V = ({scaled_vec[0]:.3f}, {scaled_vec[1]:.3f}, {scaled_vec[2]:.3f})",
-                font=("Arial", 11, "bold"), bg="white", fg=PRIMARY_GREEN).pack(pady=5)
+                **RESULT_LABEL_STYLE).pack(pady=5)
         
         # Formula
         formula_frame = tk.Frame(self.info_frame, bg="#f0f8ff", bd=1, relief="solid")
         formula_frame.pack(fill="x", padx=20, pady=10)
         
-        formula = (r"$k \cdot \vec{V} = k \cdot (X, Y, Z)$" + "\n" +
-                  r"$= (" + f"{k}·{vec[0]:.2f}, {k}·{vec[1]:.2f}, {k}·{vec[2]:.2f}" + r")$" + "\n" +
-                  r"$= (" + f"{scaled_vec[0]:.2f}, {scaled_vec[1]:.2f}, {scaled_vec[2]:.2f}" + r")$")
+        formula = self.FORMULA.format(k, *vec, *scaled_vec)
         
         FormulaRenderer.render(formula_frame, formula, fontsize=12)
+        
+        # Pack the finished panel so the page lays out once, not once per child
+        self.info_frame.pack(fill="x", padx=20, pady=20)
     
     def reset(self):
         self.vector_input.reset()
@@ -688,12 +1128,30 @@ class VectorScalingLesson:
         if hasattr(self, 'info_frame'):
             self.info_frame.destroy()
         PlotManager.clear_plot(self.parent)
+    
+    def restore_defaults(self):
+        """Put the lesson back as it was first built, for Reset All"""
+        self.reset()
+        self.vector_input.restore_defaults()
+        self.scalar_entry.delete(0, tk.END)
+        self.scalar_entry.insert(0, "2")
+        self.mode_2d.set(False)
 
 class VectorMagnitudeLesson:
+    FORMULA = (r"$|\vec{{V}}| = \sqrt{{X^2 + Y^2 + Z^2}} = {0:.4f}$" "\n"
+               r"$\hat{{V}} = \frac{{\vec{{V}}}}{{|\vec{{V}}|}} = ({1:.3f}, {2:.3f}, {3:.3f})$")
+    VEC_TEXT = "Vector V = ({:.3f}, {:.3f}, {:.3f})\n".format
+    MAG_TEXT = "Magnitude |V| = {:.4f}\n".format
+    DIR_TEXT = "Direction = ({:.3f}, {:.3f}, {:.3f})".format
+    
     def __init__(self, parent, app):
         self.parent = parent
         self.app = app
+        self.direction = None  # Allocated by the first normalize() and reused after that
+        self.last_vec = None
+        self.last_2d = None
         self.create_ui()
+        self.create_info_panel()
     
     def create_ui(self):
         # Title
@@ -701,43 +1159,44 @@ class VectorMagnitudeLesson:
                         font=("Arial", 16, "bold"), bg="white", fg=BORDER_COLOR)
         title.pack(pady=(10, 20))
         
-        # Input frame
+        # Input frame, laid out as a single grid
         input_frame = tk.Frame(self.parent, bg=BUTTON_BG, bd=2, relief="raised")
         input_frame.pack(pady=10, padx=20)
+        input_frame.columnconfigure((0, 1), weight=1, uniform="half")
         
         self.vector_input = VectorInput(input_frame, "Vector V",
                                        default_values=(3, 4, 5), bg=BUTTON_BG)
-        self.vector_input.pack(pady=10, padx=10)
+        self.vector_input.grid(row=0, column=0, columnspan=2, pady=10, padx=10)
         
-        # Buttons
-        btn_frame = tk.Frame(input_frame, bg=BUTTON_BG)
-        btn_frame.pack(pady=10)
+        # 2D plot
+        self.mode_2d = tk.BooleanVar(value=False)
+        tk.Checkbutton(input_frame, text="2D plot (hide Z axis)", variable=self.mode_2d,
+                      bg=BUTTON_BG, fg="white", selectcolor=BUTTON_BG,
+                      font=("Arial", 10), cursor="hand2").grid(row=1, column=0, columnspan=2)
         
-        tk.Button(btn_frame, text="📊 Compute Magnitude & Direction", command=self.compute,
-                 bg="#1a5490", fg="white", font=("Arial", 11, "bold"),
-                 cursor="hand2", padx=20, pady=8).pack(side="left", padx=5)
+        # Buttons
+        tk.Button(input_frame, text="📊 Compute Magnitude & Direction", command=self.compute,
+                 **PRIMARY_BTN_STYLE).grid(row=2, column=0, padx=5, pady=10, sticky="e")
         
-        tk.Button(btn_frame, text="🔄 Reset", command=self.reset,
-                 bg="#7f8c8d", fg="white", font=("Arial", 11),
-                 cursor="hand2", padx=15, pady=8).pack(side="left", padx=5)
+        tk.Button(input_frame, text="🔄 Reset", command=self.reset,
+                 **SECONDARY_BTN_STYLE).grid(row=2, column=1, padx=5, pady=10, sticky="w")
     
     def compute(self):
         vec = self.vector_input.get_vector()
-        mag = np.linalg.norm(vec)
-        if mag > 1e-10:
-            direction = vec / mag
-        else:
-            direction = np.zeros_like(vec)
-        
-        PlotManager.plot_vectors(self.parent, [vec], [PRIMARY_BLUE], ["V"], "Vector Magnitude & Direction", limits=12)
-        self.show_info(vec, mag, direction)
+        mag, self.direction = normalize(vec, out=self.direction)
+        force_2d = self.mode_2d.get()
+        
+        # Skip the plot entirely when nothing it shows has changed
+        if self.last_vec is None or force_2d != self.last_2d or not np.array_equal(vec, self.last_vec):
+            TkVectorCanvas.draw(self.parent, vec, PRIMARY_BLUE, "V", "Vector Magnitude & Direction", limits=12,
+                                force_2d=force_2d)
+            self.last_vec = vec.copy()
+            self.last_2d = force_2d
+        self.show_info(vec, mag, self.direction)
     
-    def show_info(self, vec, mag, direction):
-        if hasattr(self, 'info_frame'):
-            self.info_frame.destroy()
-        
+    def create_info_panel(self):
+        """Build the results panel once; show_info only updates its text and image"""
         self.info_frame = tk.Frame(self.parent, bg="#f5f5f5", bd=2, relief="groove")
-        self.info_frame.pack(fill="x", padx=20, pady=20)
         
         # Title
         tk.Label(self.info_frame, text="📐 Vector Analysis",
@@ -747,28 +1206,49 @@ class VectorMagnitudeLesson:
         res_frame = tk.Frame(self.info_frame, bg="white", bd=1, relief="solid")
         res_frame.pack(fill="x", padx=20, pady=5)
         
-        tk.Label(res_frame, text=f"Vector V = ({vec[0]:.3f}, {vec[1]:.3f}, {vec[2]:.3f})",
-                font=("Arial", 10), bg="white", fg=PRIMARY_BLUE).pack(pady=3)
-        tk.Label(res_frame, text=f"Magnitude |V| = {mag:.4f}",
-                font=("Arial", 11, "bold"), bg="white", fg=PRIMARY_GREEN).pack(pady=3)
-        tk.Label(res_frame, text=f"Direction = ({direction[0]:.3f}, {direction[1]:.3f}, {direction[2]:.3f})",
-                font=("Arial", 10), bg="white", fg=PRIMARY_RED).pack(pady=3)
+        # One Text widget with a colour tag per line instead of three labels
+        self.result_text = tk.Text(res_frame, height=3, font=("Arial", 10), bg="white",
+                                  bd=0, highlightthickness=0, cursor="arrow",
+                                  spacing1=3, spacing3=3)
+        self.result_text.tag_configure("all", justify="center")
+        self.result_text.tag_configure("vec", foreground=PRIMARY_BLUE)
+        self.result_text.tag_configure("mag", foreground=PRIMARY_GREEN, font=BOLD_FONT)
+        self.result_text.tag_configure("dir", foreground=PRIMARY_RED)
+        self.result_text.pack(fill="x", pady=3)
         
         # Formula
         formula_frame = tk.Frame(self.info_frame, bg="#f0f8ff", bd=1, relief="solid")
         formula_frame.pack(fill="x", padx=20, pady=10)
         
-        formula = (r"$|\vec{V}| = \sqrt{X^2 + Y^2 + Z^2} = " + f"{mag:.4f}$\n" +
-                   r"$\hat{V} = \frac{\vec{V}}{|\vec{V}|} = (" +
-                   f"{direction[0]:.3f}, {direction[1]:.3f}, {direction[2]:.3f})$")
-        
-        FormulaRenderer.render(formula_frame, formula, fontsize=12)
+        self.formula_label = tk.Label(formula_frame, bg='#f0f8ff')
+        self.formula_label.pack(fill="both", expand=True, padx=8, pady=6)
+    
+    def show_info(self, vec, mag, direction):
+        self.result_text.config(state="normal")
+        self.result_text.delete("1.0", "end")
+        self.result_text.insert("end",
+                                self.VEC_TEXT(*vec), ("all", "vec"),
+                                self.MAG_TEXT(mag), ("all", "mag"),
+                                self.DIR_TEXT(*direction), ("all", "dir"))
+        self.result_text.config(state="disabled")
+        
+        formula = self.FORMULA.format(mag, *direction)
+        FormulaRenderer.update(self.formula_label, formula, fontsize=12)
+        
+        if not self.info_frame.winfo_manager():
+            self.info_frame.pack(fill="x", padx=20, pady=20)
     
     def reset(self):
         self.vector_input.reset()
-        if hasattr(self, 'info_frame'):
-            self.info_frame.destroy()
+        self.info_frame.pack_forget()
+        self.last_vec = None
         PlotManager.clear_plot(self.parent)
+    
+    def restore_defaults(self):
+        """Put the lesson back as it was first built, for Reset All"""
+        self.reset()
+        self.vector_input.restore_defaults()
+        self.mode_2d.set(False)
 
 # ------------- Run App -------------
 if __name__ == "__main__":